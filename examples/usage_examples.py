@@ -20,37 +20,66 @@ async def example_standalone_usage():
     
     # Create a temporary directory for downloads
     with tempfile.TemporaryDirectory() as temp_dir:
-        downloader = PDFDownloader()
+        # The context manager keeps one pooled session open for every
+        # download made through it and closes it on exit
+        async with PDFDownloader() as downloader:
+            try:
+                # Example PDF URL (replace with a real PDF URL for testing)
+                test_url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
+                
+                print(f"? Downloading from: {test_url}")
+                print(f"? Saving to: {temp_dir}")
+                
+                result = await downloader.download_pdf(
+                    url=test_url,
+                    destination_path=temp_dir,
+                    filename="example_download.pdf",
+                    max_retries=3,
+                    retry_delay=2.0,
+                    timeout=30.0
+                )
+                
+                print("? Download Result:")
+                print(json.dumps(result, indent=2))
+                
+            except Exception as e:
+                print(f"? Error during download: {e}")
+
+
+async def example_batch_usage():
+    """Example of downloading several PDFs concurrently."""
+    print("\n? Example 2: Batch downloads with download_pdfs")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
         
-        try:
-            # Example PDF URL (replace with a real PDF URL for testing)
-            test_url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
-            
-            print(f"? Downloading from: {test_url}")
-            print(f"? Saving to: {temp_dir}")
-            
-            result = await downloader.download_pdf(
-                url=test_url,
-                destination_path=temp_dir,
-                filename="example_download.pdf",
-                max_retries=3,
-                retry_delay=2.0,
-                timeout=30.0
-            )
-            
-            print("? Download Result:")
-            print(json.dumps(result, indent=2))
-            
-        except Exception as e:
-            print(f"? Error during download: {e}")
+        # Each job holds the keyword arguments for one download_pdf call
+        jobs = [
+            {
+                "url": test_url,
+                "destination_path": temp_dir,
+                "filename": f"batch_{i}.pdf",
+                "max_retries": 2,
+                "retry_delay": 1.0
+            }
+            for i in range(5)
+        ]
         
-        finally:
-            await downloader._close_session()
+        async with PDFDownloader() as downloader:
+            try:
+                results = await downloader.download_pdfs(jobs)
+                
+                for job, result in zip(jobs, results):
+                    status = "ok" if result["success"] else result["error_message"]
+                    print(f"? {job['filename']}: {status}")
+                    
+            except Exception as e:
+                print(f"? Error during batch download: {e}")
 
 
 async def example_mcp_tool_usage():
     """Example of using the MCP server tool interface."""
-    print("\n? Example 2: Using MCP Server Tool Interface")
+    print("\n? Example 3: Using MCP Server Tool Interface")
     
     # Create server instance
     server = PDFDownloaderServer()
@@ -81,11 +110,14 @@ async def example_mcp_tool_usage():
                 
     except Exception as e:
         print(f"? Error during MCP tool call: {e}")
+    
+    finally:
+        await server.downloader.aclose()
 
 
 def example_configuration():
     """Example of different configuration options."""
-    print("\n? Example 3: Configuration Options")
+    print("\n? Example 4: Configuration Options")
     
     print("? Available configuration options for download_pdf:")
     
@@ -129,10 +161,13 @@ async def main():
     # Example 1: Direct usage
     await example_standalone_usage()
     
-    # Example 2: MCP tool usage  
+    # Example 2: Batch downloads
+    await example_batch_usage()
+    
+    # Example 3: MCP tool usage  
     await example_mcp_tool_usage()
     
-    # Example 3: Configuration options
+    # Example 4: Configuration options
     example_configuration()
     
     print("\n" + "=" * 50)
@@ -12,7 +12,7 @@ from typing import Optional
 
 import click
 
-from .server import PDFDownloaderServer
+from .server import PDFDownloaderServer, cancel_on_sigterm
 
 
 @click.command()
@@ -70,25 +70,31 @@ async def _run_server() -> None:
     
     # Create server instance
     server_instance = PDFDownloaderServer()
+    cancel_on_sigterm()
     
     click.echo("? Starting PDF Downloader MCP Server...", err=True)
     click.echo("? Using stdio transport", err=True)
     click.echo("? Ready to handle PDF download requests", err=True)
     
     # Run with stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await server_instance.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="pdf-downloader-mcp",
-                server_version="1.0.0",
-                capabilities=server_instance.server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server_instance.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="pdf-downloader-mcp",
+                    server_version="1.0.0",
+                    capabilities=server_instance.server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    except asyncio.CancelledError:
+        click.echo("\n? Server shutdown requested", err=True)
+    finally:
+        await server_instance.downloader.aclose()
 
 
 def cli() -> None:
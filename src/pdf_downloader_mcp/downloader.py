@@ -9,15 +9,43 @@ This module provides the core downloading functionality with:
 """
 
 import asyncio
+import errno
+import functools
+import hashlib
+import json
 import logging
+import math
+import os
+import random
+import socket
+import ssl
+import sys
 import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
-from urllib.parse import urlparse, unquote
+from typing import Optional, Callable, Dict, Any, List, Mapping, Sequence, Set, Tuple, Type
+from urllib.parse import unquote, urlparse
 import aiohttp
-import aiofiles
 from aiohttp import ClientSession, ClientTimeout, ClientResponseError
 
+# aiohttp's AsyncResolver needs aiodns with getaddrinfo (3.2+) and, like
+# aiohttp's own speedups extra, is only used on Linux and macOS; Windows'
+# default proactor event loop cannot run it
+try:
+    import aiodns  # optional, enables aiohttp.AsyncResolver
+    _HAS_AIODNS = (
+        hasattr(aiodns.DNSResolver, 'getaddrinfo')
+        and sys.platform in ('linux', 'darwin')
+    )
+    _AIODNS_ERROR: Optional[Type[BaseException]] = aiodns.error.DNSError
+    # c-ares status codes meaning the host name does not exist
+    _UNKNOWN_HOST_ARES_CODES = frozenset((aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA))
+except ImportError:
+    _HAS_AIODNS = False
+    _AIODNS_ERROR = None
+    _UNKNOWN_HOST_ARES_CODES = frozenset()
+
 from .exceptions import (
     DownloadError,
     RetryableError,
@@ -33,6 +61,290 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Request headers shared by every session; the User-Agent is added per session.
+# PDFs are already compressed, so only identity content-encoding is accepted:
+# bytes go straight to disk and Range offsets match the stored file. Chunked
+# transfer-encoding is unaffected and still decoded by aiohttp.
+_STATIC_HEADERS = {
+    "Accept": "application/pdf,application/octet-stream,*/*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "identity",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+# Session-wide timeout: 5 min total, 30s connect
+_SESSION_TIMEOUT = ClientTimeout(total=300, connect=30)
+
+# Maximum delay between retries (in seconds)
+_MAX_RETRY_DELAY = 300.0
+
+# HTTP statuses that will not change by retrying
+_PERMANENT_HTTP_STATUSES = frozenset({400, 401, 403, 404, 405, 410, 451})
+
+# Client error statuses that are worth retrying after a delay
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+# Statuses whose Retry-After header, when present, sets the retry delay
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# Errors meaning the destination filesystem cannot hold the file
+_NO_SPACE_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('ENOSPC', 'EDQUOT') if hasattr(errno, name)
+)
+
+# getaddrinfo errors meaning the host name does not exist (NXDOMAIN)
+_UNKNOWN_HOST_ERRNOS = frozenset(
+    getattr(socket, name) for name in ('EAI_NONAME', 'EAI_NODATA') if hasattr(socket, name)
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_filename(url: str) -> str:
+    """Extract a sanitized PDF filename from a URL."""
+    parsed = urlparse(url)
+    filename = unquote(parsed.path.split('/')[-1])
+    
+    if not filename:
+        filename = "document.pdf"
+    
+    # Ensure .pdf extension
+    if not filename.lower().endswith('.pdf'):
+        filename += '.pdf'
+    
+    return sanitize_filename(filename)
+
+
+# Most buffers accepted by a single writev call on Linux, macOS and BSD
+_MAX_IOVECS = 1024
+
+
+def _write_all(fd: int, chunks: List[bytes], offset: Optional[int] = None) -> None:
+    """
+    Write a list of chunks to fd, continuing after short writes.
+    
+    The chunks are handed to the kernel as they are with writev/pwritev,
+    so no joined copy is made. When offset is given the data is written
+    there, leaving the descriptor's file position untouched. Platforms
+    without vectored I/O fall back to a single joined write.
+    """
+    vectored = getattr(os, 'writev' if offset is None else 'pwritev', None)
+    if vectored is None:
+        views = [memoryview(b"".join(chunks))]
+    else:
+        views = [memoryview(chunk) for chunk in chunks]
+    
+    index = 0
+    while index < len(views):
+        batch = views[index:index + _MAX_IOVECS]
+        if vectored is None:
+            written = os.write(fd, batch[0]) if offset is None else os.pwrite(fd, batch[0], offset)
+        elif offset is None:
+            written = os.writev(fd, batch)
+        else:
+            written = os.pwritev(fd, batch, offset)
+        if offset is not None:
+            offset += written
+        
+        # Skip fully written buffers and trim a partially written one
+        while index < len(views) and written >= len(views[index]):
+            written -= len(views[index])
+            index += 1
+        if written:
+            views[index] = views[index][written:]
+
+
+def _write_and_hash(
+    fd: int,
+    chunks: List[bytes],
+    offset: Optional[int] = None,
+    hasher: Optional[Any] = None
+) -> None:
+    """Write chunks with _write_all, feeding them to hasher on the way."""
+    if hasher is not None:
+        for chunk in chunks:
+            hasher.update(chunk)
+    _write_all(fd, chunks, offset)
+
+
+def _hash_file(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file, read block by block."""
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(functools.partial(f.read, block_size), b''):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Return the seconds elapsed since a time.monotonic_ns() reading."""
+    return (time.monotonic_ns() - start_ns) / 1e9
+
+
+async def _wait_all(futures: Sequence["asyncio.Future[Any]"]) -> None:
+    """
+    Wait until every future is done, even if cancelled meanwhile.
+    
+    Used where work on a file descriptor has to end before the descriptor
+    is closed. A cancellation received while waiting is raised once all
+    futures are done, and their exceptions count as retrieved.
+    """
+    cancelled = False
+    pending = [future for future in futures if not future.done()]
+    while pending:
+        try:
+            await asyncio.wait(pending)
+        except asyncio.CancelledError:
+            cancelled = True
+        pending = [future for future in pending if not future.done()]
+    
+    for future in futures:
+        if not future.cancelled():
+            future.exception()
+    if cancelled:
+        raise asyncio.CancelledError()
+
+
+def _parse_content_range(header: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a ``Content-Range: bytes start-end/total`` header.
+    
+    Returns:
+        Tuple of (start, end, total) with an inclusive end, or None if the
+        header is missing or malformed. Parts sent as * are returned as -1,
+        as in the ``bytes */total`` form used by 416 responses.
+    """
+    if not header or not header.startswith('bytes '):
+        return None
+    try:
+        byte_range, total = header[6:].strip().split('/', 1)
+        if byte_range == '*':
+            start = end = -1
+        else:
+            first, last = byte_range.split('-', 1)
+            start, end = int(first), int(last)
+        return start, end, -1 if total == '*' else int(total)
+    except ValueError:
+        return None
+
+
+def _is_identity_encoded(headers: Mapping[str, str]) -> bool:
+    """
+    Tell whether a response body arrives without a content-coding.
+    
+    aiohttp decodes gzip and similar bodies on the fly, so for those
+    Content-Length and Content-Range count encoded bytes, not file bytes.
+    """
+    return headers.get('Content-Encoding', 'identity').strip().lower() in ('', 'identity')
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Size a file and, where supported, reserve its blocks up front.
+    
+    Reserving the whole file at once lets the filesystem pick contiguous
+    extents instead of growing the file write by write, and a full disk is
+    reported before anything is downloaded.
+    """
+    os.ftruncate(fd, size)
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError as e:
+            if e.errno in _NO_SPACE_ERRNOS:
+                raise
+            logger.debug("posix_fallocate not available: %s", e)
+
+
+class _RangeNotSupported(Exception):
+    """Raised when a server answers a Range request with the full body."""
+
+
+@dataclass
+class DownloadOutcome:
+    """
+    Result of one download attempt.
+    
+    Failures are returned rather than raised so the retry loop in
+    download_pdf can branch on ok instead of unwinding through handlers.
+    """
+    
+    __slots__ = ("ok", "error", "stats")
+    
+    ok: bool
+    error: Optional[Exception]
+    stats: Dict[str, Any]
+
+
+class _FileWriter:
+    """
+    Buffered writer for a raw file descriptor.
+    
+    Chunks are kept as received and written in large vectored blocks from
+    the default executor, so the event loop never blocks on disk I/O, only
+    pays one thread hop per block and never copies the data. With an
+    offset, blocks are written positionally so several writers can share
+    one descriptor. A hasher, if given, is updated with every block in
+    the same executor call that writes it, so data written in file order
+    is checksummed without being read back.
+    """
+    
+    def __init__(
+        self,
+        fd: int,
+        buffer_size: int,
+        offset: Optional[int] = None,
+        hasher: Optional[Any] = None
+    ):
+        self._fd = fd
+        self._buffer_size = buffer_size
+        self._chunks: List[bytes] = []
+        self._buffered = 0
+        self._loop = asyncio.get_running_loop()
+        self._hasher = hasher
+        self.offset = offset
+        self.written = 0
+    
+    async def write(self, chunk: bytes) -> None:
+        """Buffer a chunk, flushing once the buffer is full."""
+        self._chunks.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self._buffer_size:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """
+        Write out any buffered data.
+        
+        A block handed to the executor is waited for even if the caller is
+        cancelled, so it is never written twice and the descriptor is not
+        closed, and its number reused, while the write is still running.
+        """
+        if not self._chunks:
+            return
+        
+        future = self._loop.run_in_executor(
+            None, _write_and_hash, self._fd, self._chunks, self.offset, self._hasher
+        )
+        try:
+            await _wait_all((future,))
+        finally:
+            if not future.cancelled() and future.exception() is None:
+                if self.offset is not None:
+                    self.offset += self._buffered
+                self.written += self._buffered
+                self._chunks = []
+                self._buffered = 0
+        future.result()
+    
+    async def close(self) -> None:
+        """Flush remaining data and close the descriptor."""
+        try:
+            await self.flush()
+        finally:
+            os.close(self._fd)
+
+
 class PDFDownloader:
     """
     Robust PDF downloader with advanced retry logic.
@@ -47,69 +359,169 @@ class PDFDownloader:
     """
     
     # Common User-Agent strings for fallback
-    USER_AGENTS = [
+    USER_AGENTS = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
         "curl/8.0.1"  # Fallback for services that prefer curl
-    ]
+    )
+    
+    # Connections per host in each session's pool. Half as many downloads
+    # run at once, however download_pdf is called, each holding a
+    # connection for its first response until all of its segments are in;
+    # the other half is shared by the extra Range requests of segmented
+    # downloads, so these never wait for a connection that only they
+    # could free
+    CONNECTIONS_PER_HOST = 30
+    
+    # Amount of data buffered before each disk write (in bytes)
+    WRITE_BUFFER_SIZE = 1024 * 1024
     
-    def __init__(self):
+    # Files at least this large are fetched as parallel Range segments
+    SEGMENTED_MIN_SIZE = 8 * 1024 * 1024
+    
+    # Target size of each segment and upper bound on their number
+    SEGMENT_SIZE = 4 * 1024 * 1024
+    MAX_SEGMENTS = 8
+    
+    def __init__(self, rotate_user_agent: bool = True):
+        """
+        Initialize the downloader.
+        
+        Args:
+            rotate_user_agent: Switch to the next User-Agent after connection
+                or SSL errors.
+        """
         self.validator = PDFValidator()
-        self._session: Optional[ClientSession] = None
+        self.rotate_user_agent = rotate_user_agent
+        
+        # One lazily created session per User-Agent, so switching agents
+        # never tears down the connections of other downloads
+        self._sessions: List[Optional[ClientSession]] = [None] * len(self.USER_AGENTS)
+        
+        # Created on first use, as before Python 3.10 asyncio primitives
+        # bind to the event loop current when they are constructed
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._download_slots: Optional[asyncio.Semaphore] = None
+        self._segment_slots: Optional[asyncio.Semaphore] = None
+        
+        # Destination directories already created by this downloader
+        self._created_dirs: Set[str] = set()
+        
+        # Error classifiers keyed by exception class, looked up along the MRO
+        self._error_handlers: Dict[type, Callable[[Any], Tuple[bool, str]]] = {
+            ClientResponseError: self._classify_http_error,
+            asyncio.TimeoutError: lambda e: (True, "Request timeout"),
+            aiohttp.ServerTimeoutError: lambda e: (True, "Request timeout"),
+            aiohttp.ClientConnectorCertificateError: lambda e: (
+                False, f"SSL certificate verification failed: {str(e)}"
+            ),
+            ssl.SSLCertVerificationError: lambda e: (
+                False, f"SSL certificate verification failed: {str(e)}"
+            ),
+            aiohttp.ClientSSLError: lambda e: (True, f"SSL error: {str(e)}"),
+            aiohttp.ClientConnectorError: self._classify_connection_error,
+            aiohttp.ClientError: lambda e: (True, f"Client error: {str(e)}"),
+            OSError: self._classify_os_error,
+        }
     
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._create_session()
+        await self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._close_session()
+        await self.aclose()
     
-    async def _create_session(self, user_agent_index: int = 0) -> ClientSession:
+    def _create_session(self, user_agent_index: int = 0) -> ClientSession:
         """Create an aiohttp session with appropriate configuration."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-        
-        timeout = ClientTimeout(total=300, connect=30)  # 5 min total, 30s connect
-        
         headers = {
-            "User-Agent": self.USER_AGENTS[user_agent_index % len(self.USER_AGENTS)],
-            "Accept": "application/pdf,application/octet-stream,*/*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1"
+            **_STATIC_HEADERS,
+            "User-Agent": self.USER_AGENTS[user_agent_index]
         }
         
+        # c-ares resolves without tying up executor threads when installed
+        resolver = aiohttp.AsyncResolver() if _HAS_AIODNS else aiohttp.ThreadedResolver()
+        
         connector = aiohttp.TCPConnector(
             limit=100,
-            limit_per_host=30,
-            ttl_dns_cache=300,
+            limit_per_host=self.CONNECTIONS_PER_HOST,
+            ttl_dns_cache=600,
             use_dns_cache=True,
-            enable_cleanup_closed=True
+            enable_cleanup_closed=True,
+            keepalive_timeout=75,
+            resolver=resolver,
+            happy_eyeballs_delay=0.25
         )
         
-        self._session = ClientSession(
-            timeout=timeout,
+        return ClientSession(
+            timeout=_SESSION_TIMEOUT,
             headers=headers,
             connector=connector,
             trust_env=True
         )
+    
+    async def _get_session(self, user_agent_index: int = 0) -> ClientSession:
+        """
+        Return the session for a User-Agent, creating it on first use.
         
-        return self._session
+        Sessions (and their connection pools) are reused across downloads
+        until aclose() is called.
+        """
+        index = user_agent_index % len(self.USER_AGENTS)
+        session = self._sessions[index]
+        if session is None or session.closed:
+            async with self._get_session_lock():
+                session = self._sessions[index]
+                if session is None or session.closed:
+                    session = self._sessions[index] = self._create_session(index)
+        return session
+    
+    async def _close_session(self) -> None:
+        """Close every open aiohttp session."""
+        for index, session in enumerate(self._sessions):
+            if session and not session.closed:
+                await session.close()
+            self._sessions[index] = None
+    
+    async def aclose(self) -> None:
+        """Close the shared sessions and release pooled connections."""
+        async with self._get_session_lock():
+            await self._close_session()
+    
+    def _get_session_lock(self) -> asyncio.Lock:
+        """Return the lock guarding session creation, creating it on first use."""
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        return self._session_lock
     
-    async def _close_session(self):
-        """Close the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+    def _batch_size(self) -> int:
+        """Return how many downloads run at once."""
+        return max(1, self.CONNECTIONS_PER_HOST // 2)
     
-    def _calculate_backoff_delay(self, attempt: int, base_delay: float) -> float:
+    def _get_download_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent downloads, see CONNECTIONS_PER_HOST."""
+        if self._download_slots is None:
+            self._download_slots = asyncio.Semaphore(self._batch_size())
+        return self._download_slots
+    
+    def _get_segment_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting extra segment requests, see CONNECTIONS_PER_HOST."""
+        if self._segment_slots is None:
+            self._segment_slots = asyncio.Semaphore(
+                self.CONNECTIONS_PER_HOST - self._batch_size()
+            )
+        return self._segment_slots
+    
+    @staticmethod
+    def _calculate_backoff_delay(attempt: int, base_delay: float) -> float:
         """
-        Calculate exponential backoff delay with jitter.
+        Calculate exponential backoff delay with full jitter.
+        
+        The delay is drawn uniformly from [0, min(base_delay * 2^attempt, cap)],
+        which spreads out clients that failed at the same moment.
         
         Args:
             attempt: Current attempt number (0-based)
@@ -118,16 +530,9 @@ class PDFDownloader:
         Returns:
             Delay in seconds with exponential backoff and jitter
         """
-        import random
-        
-        # Exponential backoff: base_delay * (2 ^ attempt)
-        delay = base_delay * (2 ** attempt)
-        
-        # Add jitter (?25% of delay) to prevent thundering herd
-        jitter = delay * 0.25 * (2 * random.random() - 1)
-        
-        # Cap maximum delay at 5 minutes
-        return min(delay + jitter, 300.0)
+        # Shifts past 30 are capped anyway, and huge ones overflow a float
+        ceiling = min(base_delay * (1 << min(attempt, 30)), _MAX_RETRY_DELAY)
+        return random.random() * ceiling
     
     def _classify_error(self, error: Exception) -> Tuple[bool, str]:
         """
@@ -139,154 +544,517 @@ class PDFDownloader:
         Returns:
             Tuple of (should_retry, error_description)
         """
-        if isinstance(error, ClientResponseError):
-            status = error.status
-            
-            # Permanent errors - don't retry
-            if status in [400, 401, 403, 404, 410, 451]:
-                return False, f"HTTP {status}: {error.message}"
-            
-            # Rate limiting - retry with longer delay
-            if status == 429:
-                return True, f"Rate limited (HTTP 429)"
-            
-            # Server errors - retry
-            if status >= 500:
-                return True, f"Server error (HTTP {status})"
-            
-            # Other client errors - don't retry
-            if 400 <= status < 500:
-                return False, f"Client error (HTTP {status})"
-                
+        for cls in type(error).__mro__:
+            handler = self._error_handlers.get(cls)
+            if handler is not None:
+                return handler(error)
+        
+        # Unknown errors - try once more
+        return True, f"Unknown error: {str(error)}"
+    
+    def _classify_http_error(self, error: ClientResponseError) -> Tuple[bool, str]:
+        """Classify an HTTP error response by its status code."""
+        status = error.status
+        
+        # Permanent errors - don't retry
+        if status in _PERMANENT_HTTP_STATUSES:
+            return False, f"HTTP {status}: {error.message}"
+        
+        # Rate limiting - retry with longer delay
+        if status == 429:
+            return True, f"Rate limited (HTTP 429)"
+        
+        # Request timeout - the server may answer in time on another try
+        if status in _RETRYABLE_CLIENT_STATUSES:
             return True, f"HTTP {status}: {error.message}"
         
-        elif isinstance(error, asyncio.TimeoutError):
-            return True, "Request timeout"
+        # Server errors - retry
+        if status >= 500:
+            return True, f"Server error (HTTP {status})"
         
-        elif isinstance(error, aiohttp.ClientConnectorError):
-            return True, f"Connection error: {str(error)}"
+        # Other client errors - don't retry
+        if 400 <= status < 500:
+            return False, f"Client error (HTTP {status})"
         
-        elif isinstance(error, aiohttp.ClientSSLError):
-            return True, f"SSL error: {str(error)}"
+        # Statuses below 400 only arrive via redirect failures such as
+        # TooManyRedirects, which may succeed against a fresh connection
+        return True, f"HTTP {status}: {error.message}"
+    
+    def _classify_connection_error(self, error: aiohttp.ClientConnectorError) -> Tuple[bool, str]:
+        """Classify a connection failure, treating unknown hosts as permanent."""
+        if getattr(error.os_error, 'errno', None) in _UNKNOWN_HOST_ERRNOS:
+            return False, f"Host not found: {error.host}"
         
-        elif isinstance(error, aiohttp.ClientError):
-            return True, f"Client error: {str(error)}"
+        # AsyncResolver re-raises c-ares failures as OSError(None, message)
+        # chained from the aiodns DNSError
+        cause = error.os_error.__cause__
+        if (_AIODNS_ERROR is not None and isinstance(cause, _AIODNS_ERROR)
+                and cause.args and cause.args[0] in _UNKNOWN_HOST_ARES_CODES):
+            return False, f"Host not found: {error.host}"
+        return True, f"Connection error: {str(error)}"
+    
+    def _classify_os_error(self, error: OSError) -> Tuple[bool, str]:
+        """Classify a local I/O error, treating a full disk as permanent."""
+        if error.errno in _NO_SPACE_ERRNOS:
+            return False, f"Not enough disk space: {str(error)}"
+        return True, f"Unknown error: {str(error)}"
+    
+    @staticmethod
+    def _retry_after_delay(error: ClientResponseError) -> Optional[float]:
+        """
+        Read the delay a 429/503 response asks for in its Retry-After header.
         
-        else:
-            # Unknown errors - try once more
-            return True, f"Unknown error: {str(error)}"
+        Returns:
+            Delay in seconds, capped at the maximum retry delay, or None if
+            the header is missing or unparsable
+        """
+        retry_after = error.headers.get('Retry-After') if error.headers else None
+        if not retry_after:
+            return None
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            # Retry-After may also be an HTTP date
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            if retry_at is None or retry_at.tzinfo is None:
+                return None
+            delay = retry_at.timestamp() - time.time()
+        return min(max(delay, 0.0), _MAX_RETRY_DELAY)
+    
+    def _ensure_directory(self, dest_dir: Path) -> None:
+        """Create a destination directory unless it was already created."""
+        key = str(dest_dir)
+        if key not in self._created_dirs:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(key)
     
     def _extract_filename_from_url(self, url: str) -> str:
         """Extract filename from URL, ensuring it's a valid PDF name."""
-        parsed = urlparse(url)
-        filename = unquote(parsed.path.split('/')[-1])
+        return _extract_filename(url)
+    
+    def _target_path(self, url: str, dest_dir: Path, filename: Optional[str]) -> Path:
+        """Return where a download is saved, naming it after the URL by default."""
+        # Names taken from the URL are already sanitized
+        if not filename:
+            filename = self._extract_filename_from_url(url)
+        else:
+            filename = sanitize_filename(filename)
+        return dest_dir / filename
+    
+    @staticmethod
+    def _partial_path(file_path: Path) -> Path:
+        """Return the path a download is written to until it validates."""
+        return file_path.with_name(file_path.name + '.part')
+    
+    @staticmethod
+    def _progress_path(file_path: Path) -> Path:
+        """Return the sidecar path used to checkpoint a segmented partial file."""
+        return file_path.with_name(file_path.name + '.json')
+    
+    def _load_progress(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load the segment checkpoint for a partially downloaded file.
         
-        if not filename or filename == '/':
-            filename = "document.pdf"
+        Returns:
+            The checkpoint, or None if there is no usable one. Stale or
+            unreadable checkpoints are removed.
+        """
+        progress_path = self._progress_path(file_path)
+        if not progress_path.exists():
+            return None
+        
+        try:
+            if not file_path.exists():
+                raise ValueError("partial file is missing")
+            progress = json.loads(progress_path.read_text())
+            total_size = int(progress["total_size"])
+            segments = [[int(start), int(end), int(done)] for start, end, done in progress["segments"]]
+            return {"total_size": total_size, "segments": segments}
+        except Exception as e:
+            logger.debug("Ignoring download checkpoint %s: %s", progress_path, e)
+            progress_path.unlink(missing_ok=True)
+            return None
+    
+    def _save_progress(self, file_path: Path, total_size: int, segments: List[List[int]]) -> None:
+        """Write the segment checkpoint for a partially downloaded file."""
+        self._progress_path(file_path).write_text(
+            json.dumps({"total_size": total_size, "segments": segments})
+        )
+    
+    def _discard_partial(self, file_path: Path) -> None:
+        """Delete a partial download together with its checkpoint."""
+        file_path.unlink(missing_ok=True)
+        self._progress_path(file_path).unlink(missing_ok=True)
+    
+    def _plan_segments(self, start: int, total_size: int) -> List[List[int]]:
+        """
+        Split the byte range [start, total_size) into download segments.
+        
+        Returns:
+            List of [start, end, bytes_done] entries with an exclusive end
+        """
+        remaining = total_size - start
+        count = max(1, min(self.MAX_SEGMENTS, math.ceil(remaining / self.SEGMENT_SIZE)))
+        step = math.ceil(remaining / count)
+        return [
+            [offset, min(offset + step, total_size), 0]
+            for offset in range(start, total_size, step)
+        ]
+    
+    async def _write_segment(
+        self,
+        response: aiohttp.ClientResponse,
+        fd: int,
+        segment: List[int],
+        hasher: Optional[Any] = None
+    ) -> int:
+        """
+        Stream a response body into one segment of the destination file.
+        
+        The body must start at the segment's first missing byte. segment is
+        updated in place with the number of bytes written, so progress
+        survives a failure. Returns the bytes downloaded.
+        """
+        start, end, done = segment
+        range_start = start + done
+        writer = _FileWriter(fd, self.WRITE_BUFFER_SIZE, offset=range_start, hasher=hasher)
+        received = 0
+        try:
+            async for chunk in response.content.iter_any():
+                # Never write past the end of this segment
+                left = end - range_start - received
+                if len(chunk) > left:
+                    chunk = chunk[:left]
+                await writer.write(chunk)
+                received += len(chunk)
+                if range_start + received >= end:
+                    break
+        finally:
+            await writer.flush()
+            segment[2] = done + writer.written
+        
+        if start + segment[2] < end:
+            raise aiohttp.ClientPayloadError(
+                f"Segment {start}-{end - 1} ended after {segment[2]} bytes"
+            )
+        return received
+    
+    async def _download_segment(
+        self,
+        session: ClientSession,
+        url: str,
+        fd: int,
+        segment: List[int],
+        total_size: int,
+        timeout: float,
+        hasher: Optional[Any] = None
+    ) -> int:
+        """Fetch the missing part of one segment with a Range request."""
+        start, end, done = segment
+        if start + done >= end:
+            return 0
         
-        # Ensure .pdf extension
-        if not filename.lower().endswith('.pdf'):
-            filename += '.pdf'
+        range_start = start + done
+        headers = {'Range': f'bytes={range_start}-{end - 1}'}
         
-        return sanitize_filename(filename)
+        # Wait for a free connection before the request timeout starts
+        async with self._get_segment_slots(), session.get(
+            url,
+            headers=headers,
+            timeout=ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            
+            content_range = _parse_content_range(response.headers.get('Content-Range'))
+            if (
+                response.status != 206
+                or not content_range
+                or content_range[0] != range_start
+                or content_range[2] not in (-1, total_size)
+                or not _is_identity_encoded(response.headers)
+            ):
+                raise _RangeNotSupported(f"Server did not honor Range for {url}")
+            
+            return await self._write_segment(response, fd, segment, hasher)
     
-    async def _check_resume_capability(self, url: str) -> Tuple[bool, int]:
+    async def _download_segmented(
+        self,
+        session: ClientSession,
+        url: str,
+        file_path: Path,
+        total_size: int,
+        existing_size: int,
+        progress: Optional[Dict[str, Any]],
+        timeout: float,
+        start_time: int,
+        response: Optional[aiohttp.ClientResponse] = None,
+        parallel: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
-        Check if the server supports partial content (resume capability).
+        Download a file of known size into a preallocated destination.
+        
+        The file is allocated up front and every segment is written at its
+        own offset. With parallel set, the missing range is split into
+        several segments fetched as concurrent HTTP Range requests;
+        otherwise it is one segment. Per-segment progress is checkpointed
+        to a sidecar file on failure so the next attempt only fetches the
+        missing ranges. An already open response starting at existing_size
+        is used for the first segment instead of issuing another request.
+        A download received as one stream from byte 0 is checksummed while
+        it is written.
         
         Returns:
-            Tuple of (supports_resume, content_length)
+            Dictionary with download statistics, or None if the server does
+            not honor Range requests and a single-stream download is needed
         """
+        if progress is not None:
+            segments = progress["segments"]
+            logger.info("Resuming segmented download of %s", file_path.name)
+        elif parallel:
+            segments = self._plan_segments(existing_size, total_size)
+        else:
+            segments = [[existing_size, total_size, 0]]
+        
+        loop = asyncio.get_running_loop()
+        fd = os.open(file_path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
         try:
-            async with self._session.head(url) as response:
-                supports_resume = response.headers.get('Accept-Ranges') == 'bytes'
-                content_length = int(response.headers.get('Content-Length', 0))
-                return supports_resume, content_length
-        except Exception as e:
-            logger.debug(f"Failed to check resume capability: {e}")
-            return False, 0
+            await loop.run_in_executor(None, _preallocate, fd, total_size)
+            self._save_progress(file_path, total_size, segments)
+            
+            # Only a single segment covering the whole file arrives in order
+            hasher = None
+            if len(segments) == 1 and segments[0][0] == 0 and segments[0][2] == 0:
+                hasher = hashlib.sha256()
+            
+            logger.info("Downloading %s in %d segments", url, len(segments))
+            tasks = []
+            for segment in segments:
+                if response is not None:
+                    coro = self._write_segment(response, fd, segment, hasher)
+                    response = None
+                else:
+                    coro = self._download_segment(
+                        session, url, fd, segment, total_size, timeout, hasher
+                    )
+                tasks.append(asyncio.ensure_future(coro))
+            try:
+                downloaded = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                try:
+                    # Every write must end before the descriptor is closed
+                    await _wait_all(tasks)
+                finally:
+                    self._save_progress(file_path, total_size, segments)
+                raise
+        except _RangeNotSupported as e:
+            logger.warning("%s, falling back to a single stream", e)
+            os.close(fd)
+            fd = -1
+            self._discard_partial(file_path)
+            return None
+        finally:
+            if fd >= 0:
+                os.close(fd)
+        
+        self._progress_path(file_path).unlink(missing_ok=True)
+        
+        return {
+            "success": True,
+            "bytes_downloaded": sum(downloaded),
+            "total_size": total_size,
+            "resumed": progress is not None or existing_size > 0,
+            "download_time": _elapsed_seconds(start_time),
+            "sha256": hasher.hexdigest() if hasher is not None else None
+        }
     
     async def _download_with_resume(
         self,
         url: str,
         file_path: Path,
-        timeout: float
-    ) -> Dict[str, Any]:
+        timeout: float,
+        user_agent_index: int = 0
+    ) -> DownloadOutcome:
         """
         Download file with resume capability if partially downloaded.
         
+        A failed resume is followed by at most one full download, and a
+        server that turns out not to honor ranges by one single-stream
+        download. Any further retrying is left to download_pdf.
+        
         Args:
             url: URL to download from
-            file_path: Local file path
+            file_path: Partial file to download into
             timeout: Request timeout
+            user_agent_index: Which User-Agent's session to use
             
         Returns:
-            Dictionary with download statistics
+            DownloadOutcome with download statistics, or the error that
+            ended the attempt
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns()
+        segmented = True
         
-        # Check if file exists and get its size
-        existing_size = 0
-        if file_path.exists():
-            existing_size = file_path.stat().st_size
-            logger.info(f"Found partial file: {existing_size} bytes")
+        try:
+            session = await self._get_session(user_agent_index)
+            
+            # A checkpoint means the file was preallocated by a segmented
+            # download, so its size says nothing about how much is present
+            progress = self._load_progress(file_path)
+            if progress is not None:
+                result = await self._download_segmented(
+                    session, url, file_path, progress["total_size"], 0, progress, timeout,
+                    start_time
+                )
+                if result is not None:
+                    return DownloadOutcome(True, None, result)
+                segmented = False
+            
+            # Check if file exists and get its size
+            existing_size = 0
+            if file_path.exists():
+                existing_size = file_path.stat().st_size
+                logger.info("Found partial file: %d bytes", existing_size)
+            
+            try:
+                result = await self._fetch(session, url, file_path, existing_size, timeout, segmented, start_time)
+            except Exception as e:
+                # Segmented downloads keep their checkpoint so the next attempt
+                # can continue them; other failed resumes start over once.
+                if existing_size == 0 or self._progress_path(file_path).exists():
+                    raise
+                logger.warning("Resume failed, attempting full download: %s", e)
+                self._discard_partial(file_path)  # Delete partial file
+                result = await self._fetch(session, url, file_path, 0, timeout, segmented, start_time)
+            
+            if result is None:
+                # The server would not serve ranges after all
+                result = await self._fetch(session, url, file_path, 0, timeout, False, start_time)
+                assert result is not None  # single-stream downloads always finish or raise
+            return DownloadOutcome(True, None, result)
         
-        # Check if server supports resume
-        supports_resume, total_size = await self._check_resume_capability(url)
+        except Exception as e:
+            return DownloadOutcome(False, e, {})
+    
+    async def _fetch(
+        self,
+        session: ClientSession,
+        url: str,
+        file_path: Path,
+        existing_size: int,
+        timeout: float,
+        segmented: bool,
+        start_time: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make one download request, resuming after existing_size bytes.
         
-        # If file is complete, return success
-        if existing_size > 0 and total_size > 0 and existing_size >= total_size:
-            logger.info("File already complete")
-            return {
-                "success": True,
-                "bytes_downloaded": 0,
-                "total_size": existing_size,
-                "resumed": True,
-                "download_time": time.time() - start_time
-            }
+        No separate HEAD probe is made: a partial file is resumed by asking
+        for the missing bytes directly, and the status and Content-Range of
+        that response tell whether the server honored the range and how
+        large the file is.
         
-        # Set up headers for resume if supported
+        Returns:
+            Dictionary with download statistics, or None if a segmented
+            download found that the server does not honor Range requests
+        """
+        # Set up headers for resume
         headers = {}
-        if supports_resume and existing_size > 0:
+        if existing_size > 0:
             headers['Range'] = f'bytes={existing_size}-'
-            logger.info(f"Resuming download from byte {existing_size}")
+            logger.info("Resuming download from byte %d", existing_size)
         
         bytes_downloaded = 0
         
-        try:
-            async with self._session.get(
-                url,
-                headers=headers,
-                timeout=ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                
-                # Open file in appropriate mode
-                mode = 'ab' if existing_size > 0 else 'wb'
-                
-                async with aiofiles.open(file_path, mode) as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        await f.write(chunk)
-                        bytes_downloaded += len(chunk)
-                
-                total_time = time.time() - start_time
-                
+        async with session.get(
+            url,
+            headers=headers,
+            timeout=ClientTimeout(total=timeout)
+        ) as response:
+            content_range = _parse_content_range(response.headers.get('Content-Range'))
+            
+            # Range starts at the end of the remote file: nothing is missing
+            if (
+                response.status == 416
+                and content_range
+                and content_range[2] == existing_size
+            ):
+                logger.info("File already complete")
                 return {
                     "success": True,
-                    "bytes_downloaded": bytes_downloaded,
-                    "total_size": existing_size + bytes_downloaded,
-                    "resumed": existing_size > 0,
-                    "download_time": total_time
+                    "bytes_downloaded": 0,
+                    "total_size": existing_size,
+                    "resumed": True,
+                    "download_time": _elapsed_seconds(start_time)
                 }
-                
-        except Exception as e:
-            # If resume failed, try full download
-            if existing_size > 0:
-                logger.warning(f"Resume failed, attempting full download: {e}")
-                if file_path.exists():
-                    file_path.unlink()  # Delete partial file
-                return await self._download_with_resume(url, file_path, timeout)
-            raise
+            
+            response.raise_for_status()
+            
+            # Servers may compress despite Accept-Encoding: identity; their
+            # sizes and ranges then count encoded bytes, so stream the
+            # decoded body from the start instead
+            identity = _is_identity_encoded(response.headers)
+            
+            if response.status == 206:
+                if not identity:
+                    raise RetryableError(
+                        f"Resumed download is {response.headers.get('Content-Encoding')}-encoded"
+                    )
+                if not content_range or content_range[0] != existing_size:
+                    raise RetryableError(
+                        f"Unexpected Content-Range for resumed download: "
+                        f"{response.headers.get('Content-Range')}"
+                    )
+                total_size = max(content_range[2], 0)
+                supports_ranges = True
+            else:
+                if existing_size > 0:
+                    logger.info("Server ignored the Range request, restarting download")
+                    existing_size = 0
+                total_size = (response.content_length or 0) if identity else 0
+                supports_ranges = response.headers.get('Accept-Ranges') == 'bytes'
+            
+            # Fetch large files as parallel segments when the server allows
+            # it. Anything bigger than one write buffer is preallocated;
+            # smaller files are written in a single block anyway.
+            remaining = total_size - existing_size
+            if hasattr(os, 'pwrite') and remaining > self.WRITE_BUFFER_SIZE:
+                parallel = (
+                    segmented
+                    and supports_ranges
+                    and remaining >= self.SEGMENTED_MIN_SIZE
+                )
+                return await self._download_segmented(
+                    session, url, file_path, total_size, existing_size, None, timeout,
+                    start_time, response, parallel=parallel
+                )
+            
+            # Open file in appropriate mode
+            flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+            flags |= os.O_APPEND if existing_size > 0 else os.O_TRUNC
+            fd = os.open(file_path, flags, 0o644)
+            
+            hasher = hashlib.sha256() if existing_size == 0 else None
+            writer = _FileWriter(fd, self.WRITE_BUFFER_SIZE, hasher=hasher)
+            try:
+                async for chunk in response.content.iter_any():
+                    await writer.write(chunk)
+                    bytes_downloaded += len(chunk)
+            finally:
+                await writer.close()
+            
+            return {
+                "success": True,
+                "bytes_downloaded": bytes_downloaded,
+                "total_size": existing_size + bytes_downloaded,
+                "resumed": existing_size > 0,
+                "download_time": _elapsed_seconds(start_time),
+                "sha256": hasher.hexdigest() if hasher is not None else None
+            }
     
     async def download_pdf(
         self,
@@ -311,7 +1079,7 @@ class PDFDownloader:
         Returns:
             Dictionary with download result and statistics
         """
-        overall_start_time = time.time()
+        overall_start_time = time.monotonic_ns()
         
         # Validate inputs
         if not url or not destination_path:
@@ -319,105 +1087,171 @@ class PDFDownloader:
         
         # Prepare file paths
         dest_dir = Path(destination_path)
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        
-        if not filename:
-            filename = self._extract_filename_from_url(url)
+        self._ensure_directory(dest_dir)
         
-        file_path = dest_dir / sanitize_filename(filename)
-        
-        # Initialize session
-        await self._create_session()
+        file_path = self._target_path(url, dest_dir, filename)
+        # Nothing appears under the final name until the PDF is known good
+        part_path = self._partial_path(file_path)
         
         last_error = None
+        attempts_used = 0
         user_agent_index = 0
         
-        try:
-            for attempt in range(max_retries + 1):
-                try:
-                    logger.info(f"Download attempt {attempt + 1}/{max_retries + 1}: {url}")
-                    
-                    # Download with resume capability
-                    result = await self._download_with_resume(url, file_path, timeout)
-                    
-                    # Validate downloaded file
-                    if file_path.exists():
-                        validation_result = await self.validator.validate_pdf(file_path)
-                        if not validation_result["is_valid"]:
-                            raise ValidationError(f"Invalid PDF: {validation_result['error']}")
+        for attempt in range(max_retries + 1):
+            attempts_used = attempt + 1
+            logger.info("Download attempt %d/%d: %s", attempt + 1, max_retries + 1, url)
+            
+            # Download with resume capability, leaving connections for the
+            # segments of downloads already running
+            async with self._get_download_slots():
+                outcome = await self._download_with_resume(
+                    url, part_path, timeout, user_agent_index
+                )
+            
+            if outcome.ok:
+                # Validate downloaded file
+                validation_result = await self.validator.validate_pdf(part_path)
+                if validation_result["is_valid"]:
+                    os.replace(part_path, file_path)
                     
                     # Success! Calculate final statistics
-                    file_size = file_path.stat().st_size
-                    total_time = time.time() - overall_start_time
+                    result = outcome.stats
+                    file_size = validation_result["file_size"]
+                    
+                    # Resumed and parallel downloads were not written in
+                    # order, so their checksum needs a pass over the file
+                    sha256 = result.get("sha256")
+                    if sha256 is None:
+                        sha256 = await asyncio.get_running_loop().run_in_executor(
+                            None, _hash_file, file_path
+                        )
+                    total_time = _elapsed_seconds(overall_start_time)
                     avg_speed = calculate_download_speed(file_size, result["download_time"])
                     
                     return {
                         "success": True,
                         "local_path": str(file_path.absolute()),
                         "file_size": file_size,
-                        "attempts_used": attempt + 1,
+                        "attempts_used": attempts_used,
                         "max_retries": max_retries,
                         "download_time": result["download_time"],
                         "total_time": total_time,
                         "average_speed": f"{avg_speed:.2f}",
                         "resumed": result.get("resumed", False),
                         "bytes_downloaded": result["bytes_downloaded"],
+                        "sha256": sha256,
                         "error_message": None
                     }
-                    
-                except Exception as error:
-                    last_error = error
-                    should_retry, error_desc = self._classify_error(error)
-                    
-                    logger.warning(f"Attempt {attempt + 1} failed: {error_desc}")
-                    
-                    # Clean up partial file on certain errors
-                    if isinstance(error, (ValidationError, ClientResponseError)) and file_path.exists():
-                        file_path.unlink()
-                    
-                    # If this was the last attempt or error is non-retryable
-                    if attempt >= max_retries or not should_retry:
-                        break
-                    
-                    # Special handling for rate limiting
-                    if isinstance(error, ClientResponseError) and error.status == 429:
-                        # Extract retry-after header if available
-                        retry_after = error.headers.get('Retry-After')
-                        if retry_after:
-                            try:
-                                delay = float(retry_after)
-                            except ValueError:
-                                delay = self._calculate_backoff_delay(attempt, retry_delay)
-                        else:
-                            delay = self._calculate_backoff_delay(attempt, retry_delay * 2)
-                    else:
-                        delay = self._calculate_backoff_delay(attempt, retry_delay)
-                    
-                    logger.info(f"Retrying in {delay:.1f} seconds...")
-                    await asyncio.sleep(delay)
-                    
-                    # Try different User-Agent on connection/SSL errors
-                    if isinstance(error, (aiohttp.ClientConnectorError, aiohttp.ClientSSLError)):
-                        user_agent_index += 1
-                        await self._create_session(user_agent_index)
+                
+                error: Exception = ValidationError(
+                    f"Invalid PDF: {'; '.join(validation_result['errors'])}"
+                )
+            else:
+                assert outcome.error is not None  # failed outcomes carry their error
+                error = outcome.error
             
-            # All attempts failed
-            total_time = time.time() - overall_start_time
-            error_msg = f"Failed after {max_retries + 1} attempts. Last error: {str(last_error)}"
+            last_error = error
+            should_retry, error_desc = self._classify_error(error)
             
-            return {
-                "success": False,
-                "local_path": None,
-                "file_size": 0,
-                "attempts_used": max_retries + 1,
-                "max_retries": max_retries,
-                "download_time": 0,
-                "total_time": total_time,
-                "average_speed": "0.00",
-                "resumed": False,
-                "bytes_downloaded": 0,
-                "error_message": error_msg
-            }
+            # The directory may have been removed since it was created
+            if isinstance(error, FileNotFoundError):
+                self._created_dirs.discard(str(dest_dir))
+                self._ensure_directory(dest_dir)
             
-        finally:
-            await self._close_session()
+            logger.warning("Attempt %d failed: %s", attempt + 1, error_desc)
+            
+            # Clean up the partial file once it cannot be resumed; a file
+            # preallocated on a full disk only holds space the user needs
+            # back. Retryable failures keep it and its checkpoint, so the
+            # next attempt only requests the missing bytes.
+            if isinstance(error, ValidationError) or not should_retry:
+                self._discard_partial(part_path)
+            
+            # If this was the last attempt or error is non-retryable
+            if attempt >= max_retries or not should_retry:
+                break
+            
+            if isinstance(error, FileNotFoundError):
+                # The directory was re-created above, there is nothing to wait for
+                delay = 0.0
+            elif isinstance(error, ClientResponseError) and error.status in _RETRY_AFTER_STATUSES:
+                # Honor the server's Retry-After; rate limits otherwise back off longer
+                retry_after = self._retry_after_delay(error)
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    base_delay = retry_delay * 2 if error.status == 429 else retry_delay
+                    delay = self._calculate_backoff_delay(attempt, base_delay)
+            else:
+                delay = self._calculate_backoff_delay(attempt, retry_delay)
+            
+            if delay > 0:
+                logger.info("Retrying in %.1f seconds...", delay)
+                await asyncio.sleep(delay)
+            
+            # Try different User-Agent on connection/SSL errors
+            if self.rotate_user_agent and isinstance(
+                error, (aiohttp.ClientConnectorError, aiohttp.ClientSSLError)
+            ):
+                user_agent_index += 1
+        
+        # All attempts failed
+        total_time = _elapsed_seconds(overall_start_time)
+        error_msg = f"Failed after {attempts_used} attempts. Last error: {str(last_error)}"
+        
+        return {
+            "success": False,
+            "local_path": None,
+            "file_size": 0,
+            "attempts_used": attempts_used,
+            "max_retries": max_retries,
+            "download_time": 0,
+            "total_time": total_time,
+            "average_speed": "0.00",
+            "resumed": False,
+            "bytes_downloaded": 0,
+            "sha256": None,
+            "error_message": error_msg
+        }
+    
+    async def download_pdfs(self, jobs: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Download several PDF files concurrently.
+        
+        At most half of CONNECTIONS_PER_HOST downloads run at once, leaving
+        connections for the segments of large files; download_pdf enforces
+        this for every caller. If one of them raises, the others are
+        cancelled and the error is propagated.
+        
+        Args:
+            jobs: Keyword arguments for download_pdf, one mapping per file
+            
+        Returns:
+            List of download_pdf results, in the same order as jobs
+            
+        Raises:
+            ValidationError: If two jobs would download to the same file
+        """
+        # Concurrent downloads of one file would write into each other's
+        # partial file, so refuse the batch before anything starts
+        targets: Dict[Path, int] = {}
+        for index, job in enumerate(jobs):
+            if not job.get("url") or not job.get("destination_path"):
+                continue  # download_pdf reports the missing input
+            target = self._target_path(
+                job["url"], Path(job["destination_path"]), job.get("filename")
+            ).resolve()
+            if target in targets:
+                raise ValidationError(
+                    f"Jobs {targets[target]} and {index} both download to {target}"
+                )
+            targets[target] = index
+        
+        tasks = [asyncio.ensure_future(self.download_pdf(**job)) for job in jobs]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
@@ -8,6 +8,7 @@ retry logic, error handling, and partial download recovery.
 
 import asyncio
 import logging
+import signal
 from typing import Any, Sequence
 
 from mcp.server.models import InitializationOptions
@@ -29,6 +30,56 @@ from .utils import setup_logging
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Tool definitions are static, so they are built once and shared by every
+# list_tools request
+_DOWNLOAD_PDF_TOOL = Tool(
+    name="download_pdf",
+    description="Download a PDF file from a URL to a local directory with robust retry logic",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "Direct URL to the PDF file",
+                "format": "uri"
+            },
+            "destination_path": {
+                "type": "string",
+                "description": "Local directory path where the PDF should be saved"
+            },
+            "filename": {
+                "type": "string",
+                "description": "Custom filename for the downloaded PDF (optional, defaults to URL filename)",
+                "default": None
+            },
+            "max_retries": {
+                "type": "integer",
+                "description": "Maximum number of retry attempts (default: 3)",
+                "minimum": 0,
+                "maximum": 10,
+                "default": 3
+            },
+            "retry_delay": {
+                "type": "number",
+                "description": "Base delay in seconds between retries (default: 5.0)",
+                "minimum": 0.1,
+                "maximum": 60.0,
+                "default": 5.0
+            },
+            "timeout": {
+                "type": "number",
+                "description": "Request timeout in seconds (default: 30.0)",
+                "minimum": 5.0,
+                "maximum": 300.0,
+                "default": 30.0
+            }
+        },
+        "required": ["url", "destination_path"]
+    }
+)
+
+_TOOLS = [_DOWNLOAD_PDF_TOOL]
+
 class PDFDownloaderServer:
     """MCP Server for PDF downloading with robust error handling."""
     
@@ -43,53 +94,7 @@ class PDFDownloaderServer:
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="download_pdf",
-                    description="Download a PDF file from a URL to a local directory with robust retry logic",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "url": {
-                                "type": "string",
-                                "description": "Direct URL to the PDF file",
-                                "format": "uri"
-                            },
-                            "destination_path": {
-                                "type": "string",
-                                "description": "Local directory path where the PDF should be saved"
-                            },
-                            "filename": {
-                                "type": "string",
-                                "description": "Custom filename for the downloaded PDF (optional, defaults to URL filename)",
-                                "default": None
-                            },
-                            "max_retries": {
-                                "type": "integer",
-                                "description": "Maximum number of retry attempts (default: 3)",
-                                "minimum": 0,
-                                "maximum": 10,
-                                "default": 3
-                            },
-                            "retry_delay": {
-                                "type": "number",
-                                "description": "Base delay in seconds between retries (default: 5.0)",
-                                "minimum": 0.1,
-                                "maximum": 60.0,
-                                "default": 5.0
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Request timeout in seconds (default: 30.0)",
-                                "minimum": 5.0,
-                                "maximum": 300.0,
-                                "default": 30.0
-                            }
-                        },
-                        "required": ["url", "destination_path"]
-                    }
-                )
-            ]
+            return list(_TOOLS)
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
@@ -144,7 +149,8 @@ class PDFDownloaderServer:
 ? File Size: {result['file_size']:,} bytes ({result['file_size'] / 1024 / 1024:.2f} MB)
 ? Attempts Used: {result['attempts_used']}/{result.get('max_retries', 'unknown')}
 ??  Download Time: {result['download_time']:.2f} seconds
-? Average Speed: {result.get('average_speed', 'unknown')} MB/s"""
+? Average Speed: {result.get('average_speed', 'unknown')} MB/s
+? SHA-256: {result.get('sha256') or 'unknown'}"""
         else:
             return f"""? PDF Download Failed
 
@@ -157,29 +163,52 @@ class PDFDownloaderServer:
 - Verify the destination path exists and is writable
 - Try again with increased retry count or delay"""
 
+def cancel_on_sigterm() -> None:
+    """
+    Cancel the current task on SIGTERM.
+    
+    Lets shutdown cleanup such as closing the downloader's sessions run when
+    the server is stopped by a process manager rather than by EOF on stdin.
+    """
+    task = asyncio.current_task()
+    if task is None:
+        return
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+    except (NotImplementedError, RuntimeError):
+        # Signal handlers are not supported by this event loop (Windows)
+        pass
+
+
 async def main():
     """Main entry point for the MCP server."""
     setup_logging()
     
     # Create and run the server
     server_instance = PDFDownloaderServer()
+    cancel_on_sigterm()
     
     # Run the server with stdio transport
     from mcp.server.stdio import stdio_server
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server_instance.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="pdf-downloader-mcp",
-                server_version="1.0.0",
-                capabilities=server_instance.server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server_instance.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="pdf-downloader-mcp",
+                    server_version="1.0.0",
+                    capabilities=server_instance.server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    except asyncio.CancelledError:
+        logger.info("Server shutdown requested")
+    finally:
+        await server_instance.downloader.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
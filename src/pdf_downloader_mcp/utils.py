@@ -5,11 +5,56 @@ This module provides various helper functions for file handling,
 logging setup, and data formatting.
 """
 
+import functools
+import ipaddress
 import logging
+import os
 import re
 import sys
+import time
+from collections import deque
 from pathlib import Path
-from typing import Union
+from typing import Deque, Optional, Set, Tuple, Union
+from urllib.parse import unquote, urlparse, urlsplit
+
+# Characters that are invalid in filenames on common filesystems, mapped to '_'
+_INVALID_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*\x00'})
+
+# Device names Windows reserves regardless of extension
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+# Any whitespace, which is never valid inside a URL
+_WHITESPACE_RE = re.compile(r'\s')
+
+# A single DNS label; anchored and without nested quantifiers, so linear time
+_HOST_LABEL_RE = re.compile(r'^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$', re.IGNORECASE)
+
+# Lowercase substrings of common PDF-serving URLs, built once at import
+_PDF_URL_PATTERNS = (
+    '.pdf?',
+    '.pdf#',
+    '/pdf/',
+    'download=pdf',
+    'format=pdf',
+    'type=pdf',
+    'application/pdf',
+)
+
+# Multiplier converting bytes to megabytes (MiB)
+_BYTES_PER_MB_INV = 1.0 / (1024 * 1024)
+
+# Span of recent samples ProgressTracker bases its speed on, in nanoseconds
+_SPEED_WINDOW_NS = 2_000_000_000
+
+# Destination directories already validated as writable
+_writable_dirs: Set[str] = set()
+
+# Units used by format_file_size, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def setup_logging(level: Union[str, int] = logging.INFO) -> None:
@@ -31,13 +76,13 @@ def setup_logging(level: Union[str, int] = logging.INFO) -> None:
     
     # Set specific logger levels
     logging.getLogger('aiohttp').setLevel(logging.WARNING)
-    logging.getLogger('aiofiles').setLevel(logging.WARNING)
     
     # Set our logger to debug in development
     logger = logging.getLogger('pdf_downloader_mcp')
     logger.setLevel(level)
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """
     Sanitize a filename to be safe for filesystem use.
@@ -52,23 +97,16 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     if not filename:
         return "document.pdf"
     
-    # Remove or replace invalid characters
-    # Invalid characters for most filesystems: < > : " | ? * \ /
-    invalid_chars = r'[<>:"|?*\\\/]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    # Replace invalid characters
+    sanitized = filename.translate(_INVALID_FILENAME_CHARS)
     
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(' .')
     
-    # Handle reserved names on Windows
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
-    name_without_ext = Path(sanitized).stem.upper()
-    if name_without_ext in reserved_names:
+    # Handle reserved names on Windows; separators were replaced above, so
+    # the stem is everything before the last dot
+    name_without_ext = sanitized.rsplit('.', 1)[0].upper()
+    if name_without_ext in _RESERVED_NAMES:
         sanitized = f"_{sanitized}"
     
     # Truncate if too long, but preserve extension
@@ -102,21 +140,15 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Human-readable size string (e.g., "1.5 MB")
     """
-    if size_bytes == 0:
-        return "0 B"
-    
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    unit_index = 0
-    size = float(size_bytes)
+    if size_bytes < 1024:
+        return f"{int(size_bytes)} B"
     
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    # Each unit covers 10 more bits of the size; int() keeps float sizes,
+    # which the old division loop accepted, working
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    size = size_bytes / (1 << (10 * unit_index))
     
-    if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    else:
-        return f"{size:.1f} {units[unit_index]}"
+    return f"{size:.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def calculate_download_speed(bytes_downloaded: int, time_seconds: float) -> float:
@@ -133,8 +165,7 @@ def calculate_download_speed(bytes_downloaded: int, time_seconds: float) -> floa
     if time_seconds <= 0:
         return 0.0
     
-    mb_downloaded = bytes_downloaded / (1024 * 1024)
-    return mb_downloaded / time_seconds
+    return bytes_downloaded * _BYTES_PER_MB_INV / time_seconds
 
 
 def validate_url(url: str) -> bool:
@@ -147,27 +178,62 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL appears valid, False otherwise
     """
-    if not url or not isinstance(url, str):
+    if not url or not isinstance(url, str) or _WHITESPACE_RE.search(url):
         return False
     
-    # Basic URL format check
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+    try:
+        parts = urlsplit(url)
+        port = parts.port  # raises ValueError for a malformed port
+    except ValueError:
+        return False
     
-    return bool(url_pattern.match(url))
+    if parts.scheme not in ('http', 'https') or '@' in parts.netloc:
+        return False
+    
+    # A ':' with no port after it
+    if port is None and parts.netloc.endswith(':'):
+        return False
+    
+    host = parts.hostname
+    if not host:
+        return False
+    if host == 'localhost':
+        return True
+    
+    # Only IP literals start with a digit or contain ':'
+    if host[0].isdigit() or ':' in host:
+        try:
+            ipaddress.ip_address(host)
+            return True
+        except ValueError:
+            pass
+    
+    if not host.isascii():
+        try:
+            host = host.encode('idna').decode('ascii')
+        except UnicodeError:
+            return False
+    
+    labels = host[:-1].split('.') if host.endswith('.') else host.split('.')
+    if len(labels) < 2 or not all(_HOST_LABEL_RE.match(label) for label in labels):
+        return False
+    
+    # The top-level domain is alphabetic, or an IDNA-encoded label
+    tld = labels[-1]
+    return tld.isalpha() or tld.lower().startswith('xn--')
 
 
-def validate_destination_path(path: str) -> tuple[bool, str]:
+def validate_destination_path(path: str, strict: bool = False) -> tuple[bool, str]:
     """
     Validate if a destination path is valid and accessible.
     
+    Directories that pass are remembered, so repeated calls for the same
+    destination skip the filesystem checks.
+    
     Args:
         path: Destination path to validate
+        strict: Probe writability by creating a file instead of trusting
+            os.access, e.g. for read-only mounts or ACLs it cannot see
         
     Returns:
         Tuple of (is_valid, error_message)
@@ -182,6 +248,10 @@ def validate_destination_path(path: str) -> tuple[bool, str]:
         if not path_obj.is_absolute():
             path_obj = path_obj.resolve()
         
+        key = str(path_obj)
+        if not strict and key in _writable_dirs:
+            return True, ""
+        
         # Create directory if it doesn't exist
         path_obj.mkdir(parents=True, exist_ok=True)
         
@@ -192,20 +262,25 @@ def validate_destination_path(path: str) -> tuple[bool, str]:
         if not path_obj.is_dir():
             return False, f"Path is not a directory: {path_obj}"
         
-        # Test write permissions by creating a temporary file
-        test_file = path_obj / ".write_test"
-        try:
-            test_file.touch()
-            test_file.unlink()
-        except (PermissionError, OSError) as e:
-            return False, f"Directory is not writable: {e}"
+        if strict:
+            # Test write permissions by creating a temporary file
+            test_file = path_obj / ".write_test"
+            try:
+                test_file.touch()
+                test_file.unlink()
+            except (PermissionError, OSError) as e:
+                return False, f"Directory is not writable: {e}"
+        elif not os.access(path_obj, os.W_OK | os.X_OK):
+            return False, f"Directory is not writable: {path_obj}"
         
+        _writable_dirs.add(key)
         return True, ""
         
     except Exception as e:
         return False, f"Invalid destination path: {e}"
 
 
+@functools.lru_cache(maxsize=1024)
 def get_url_filename(url: str) -> str:
     """
     Extract filename from URL path.
@@ -217,8 +292,6 @@ def get_url_filename(url: str) -> str:
         Extracted filename or default name
     """
     try:
-        from urllib.parse import urlparse, unquote
-        
         parsed = urlparse(url)
         path = unquote(parsed.path)
         
@@ -270,39 +343,38 @@ def is_pdf_url(url: str) -> bool:
     if url_lower.endswith('.pdf'):
         return True
     
-    # Check for PDF in query parameters
-    if 'pdf' in url_lower:
-        return True
-    
     # Check for common PDF-serving patterns
-    pdf_patterns = [
-        '/pdf/',
-        'download=pdf',
-        'format=pdf',
-        'type=pdf',
-        '.pdf?',
-        'application/pdf'
-    ]
-    
-    return any(pattern in url_lower for pattern in pdf_patterns)
+    return any(pattern in url_lower for pattern in _PDF_URL_PATTERNS)
 
 
 class ProgressTracker:
-    """Simple progress tracking for downloads."""
+    """
+    Simple progress tracking for downloads.
+    
+    Speed is measured over the last couple of seconds rather than the whole
+    download, so it follows changes in throughput.
+    """
     
     def __init__(self, total_size: int = 0):
         self.total_size = total_size
         self.downloaded = 0
-        self.start_time = None
+        self.start_time: Optional[int] = None
+        self._samples: Deque[Tuple[int, int]] = deque()
     
     def start(self):
         """Start tracking progress."""
-        import time
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
+        self._samples = deque([(self.start_time, self.downloaded)])
     
     def update(self, bytes_downloaded: int):
         """Update progress with new bytes downloaded."""
         self.downloaded += bytes_downloaded
+        if self.start_time is not None:
+            now = time.monotonic_ns()
+            self._samples.append((now, self.downloaded))
+            # Keep one sample older than the window as its starting point
+            while len(self._samples) > 2 and now - self._samples[1][0] >= _SPEED_WINDOW_NS:
+                self._samples.popleft()
     
     def get_progress_percent(self) -> float:
         """Get download progress as percentage."""
@@ -312,12 +384,12 @@ class ProgressTracker:
     
     def get_speed(self) -> float:
         """Get current download speed in MB/s."""
-        if not self.start_time:
+        if self.start_time is None:
             return 0.0
         
-        import time
-        elapsed = time.time() - self.start_time
-        return calculate_download_speed(self.downloaded, elapsed)
+        first_time, first_downloaded = self._samples[0]
+        elapsed = (time.monotonic_ns() - first_time) * 1e-9
+        return calculate_download_speed(self.downloaded - first_downloaded, elapsed)
     
     def get_eta(self) -> float:
         """Get estimated time remaining in seconds."""
@@ -328,5 +400,5 @@ class ProgressTracker:
         if speed <= 0:
             return 0.0
         
-        remaining_mb = (self.total_size - self.downloaded) / (1024 * 1024)
+        remaining_mb = (self.total_size - self.downloaded) * _BYTES_PER_MB_INV
         return remaining_mb / speed
@@ -7,6 +7,7 @@ to ensure they are complete and correctly formatted.
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Any
 
@@ -37,6 +38,9 @@ class PDFValidator:
         b'%PDF-2.0'
     ]
     
+    # Version bytes following "%PDF-" in the signatures above
+    _VALID_VERSIONS = frozenset(signature[5:] for signature in PDF_SIGNATURES)
+    
     # Minimum reasonable PDF size (in bytes)
     MIN_PDF_SIZE = 100
     
@@ -47,6 +51,22 @@ class PDFValidator:
         """
         Validate a PDF file asynchronously.
         
+        The checks run in the default executor so that reading and parsing
+        the file never blocks the event loop.
+        
+        Args:
+            file_path: Path to the PDF file to validate
+            
+        Returns:
+            Dictionary with validation results (see validate_pdf_sync)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.validate_pdf_sync, file_path)
+    
+    def validate_pdf_sync(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Validate a PDF file, blocking until done.
+        
         Args:
             file_path: Path to the PDF file to validate
             
@@ -70,29 +90,33 @@ class PDFValidator:
         
         try:
             # Check if file exists
-            if not file_path.exists():
+            try:
+                pdf_file = open(file_path, 'rb')
+            except FileNotFoundError:
                 result["errors"].append("File does not exist")
                 return result
             
-            # Check file size
-            file_size = file_path.stat().st_size
-            result["file_size"] = file_size
-            
-            if file_size == 0:
-                result["errors"].append("File is empty")
-                return result
-            
-            if file_size < self.MIN_PDF_SIZE:
-                result["errors"].append(f"File too small ({file_size} bytes), likely corrupted")
-                return result
-            
-            # Read file header and footer for validation
-            header_data = await self._read_file_chunk(file_path, 0, self.VALIDATION_CHUNK_SIZE)
-            footer_data = await self._read_file_chunk(
-                file_path, 
-                max(0, file_size - self.VALIDATION_CHUNK_SIZE), 
-                self.VALIDATION_CHUNK_SIZE
-            )
+            # One open serves the size check and both reads
+            with pdf_file:
+                # Check file size
+                file_size = os.fstat(pdf_file.fileno()).st_size
+                result["file_size"] = file_size
+                
+                if file_size == 0:
+                    result["errors"].append("File is empty")
+                    return result
+                
+                if file_size < self.MIN_PDF_SIZE:
+                    result["errors"].append(f"File too small ({file_size} bytes), likely corrupted")
+                    return result
+                
+                # Read file header and footer for validation
+                header_data = pdf_file.read(self.VALIDATION_CHUNK_SIZE)
+                if file_size <= self.VALIDATION_CHUNK_SIZE:
+                    footer_data = header_data
+                else:
+                    pdf_file.seek(file_size - self.VALIDATION_CHUNK_SIZE)
+                    footer_data = pdf_file.read(self.VALIDATION_CHUNK_SIZE)
             
             # Validate PDF header
             header_valid, pdf_version = self._validate_pdf_header(header_data)
@@ -121,30 +145,17 @@ class PDFValidator:
             # If we got here, the PDF is valid
             result["is_valid"] = True
             
-            logger.debug(f"PDF validation successful: {file_path} ({file_size:,} bytes, version {pdf_version})")
+            logger.debug(
+                "PDF validation successful: %s (%d bytes, version %s)",
+                file_path, file_size, pdf_version
+            )
             
         except Exception as e:
-            logger.error(f"PDF validation error for {file_path}: {e}")
+            logger.error("PDF validation error for %s: %s", file_path, e)
             result["errors"].append(f"Validation error: {str(e)}")
         
         return result
     
-    async def _read_file_chunk(self, file_path: Path, offset: int, size: int) -> bytes:
-        """Read a chunk of data from a file asynchronously."""
-        try:
-            loop = asyncio.get_event_loop()
-            
-            def read_chunk():
-                with open(file_path, 'rb') as f:
-                    f.seek(offset)
-                    return f.read(size)
-            
-            return await loop.run_in_executor(None, read_chunk)
-        
-        except Exception as e:
-            logger.error(f"Error reading file chunk from {file_path}: {e}")
-            return b''
-    
     def _validate_pdf_header(self, header_data: bytes) -> tuple[bool, str]:
         """
         Validate PDF file header.
@@ -156,18 +167,18 @@ class PDFValidator:
             return False, None
         
         # Check for PDF signature
-        for signature in self.PDF_SIGNATURES:
-            if header_data.startswith(signature):
-                version = signature.decode('ascii').split('-')[1]
-                return True, version
+        if header_data.startswith(b'%PDF-') and header_data[5:8] in self._VALID_VERSIONS:
+            return True, header_data[5:8].decode('ascii')
         
         # Check for PDF signature anywhere in the first 1024 bytes
         # (some PDFs have extra data before the PDF header)
-        for signature in self.PDF_SIGNATURES:
-            if signature in header_data:
-                version = signature.decode('ascii').split('-')[1]
+        index = header_data.find(b'%PDF-')
+        while index >= 0:
+            version = header_data[index + 5:index + 8]
+            if version in self._VALID_VERSIONS:
                 logger.warning("PDF signature found but not at file start")
-                return True, version
+                return True, version.decode('ascii')
+            index = header_data.find(b'%PDF-', index + 1)
         
         return False, None
     
@@ -183,15 +194,12 @@ class PDFValidator:
         if len(footer_data) < 10:
             return False, ["Footer data too short"]
         
-        # Look for EOF marker
-        footer_str = footer_data.decode('latin-1', errors='ignore')
-        
         # Check for proper PDF EOF
-        if '%%EOF' in footer_str:
+        if b'%%EOF' in footer_data:
             return True, warnings
         
-        # Check for common PDF trailer elements
-        if any(marker in footer_str for marker in ['trailer', 'xref', 'startxref']):
+        # Check for common PDF trailer elements ('startxref' contains 'xref')
+        if b'trailer' in footer_data or b'xref' in footer_data:
             warnings.append("PDF appears to have proper structure but missing %%EOF marker")
             return True, warnings
         
@@ -207,25 +215,23 @@ class PDFValidator:
         warnings = []
         
         try:
-            header_str = header_data.decode('latin-1', errors='ignore')
-            footer_str = footer_data.decode('latin-1', errors='ignore')
-            
             # Check for common PDF objects in header
-            if not any(obj in header_str for obj in ['obj', '<<', '>>']):
+            if not (b'obj' in header_data or b'<<' in header_data or b'>>' in header_data):
                 warnings.append("PDF header doesn't contain expected object markers")
             
             # Check for cross-reference table indicators
-            if 'xref' not in footer_str and 'xref' not in header_str:
+            if b'xref' not in footer_data and b'xref' not in header_data:
                 warnings.append("No cross-reference table found - PDF may be damaged")
             
-            # Check for catalog/root object references
-            if '/Root' not in header_str and '/Root' not in footer_str:
+            # Check for catalog/root object references; the trailer (or the
+            # cross-reference stream) near the end usually holds /Root
+            if b'/Root' not in footer_data and b'/Root' not in header_data:
                 warnings.append("No root object reference found")
             
             return True, warnings
             
         except Exception as e:
-            logger.error(f"Error during structural validation: {e}")
+            logger.error("Error during structural validation: %s", e)
             return False, [f"Structural validation failed: {str(e)}"]
     
     def get_validation_summary(self, validation_result: Dict[str, Any]) -> str:
@@ -5,8 +5,106 @@ This test verifies that the server can be initialized and the download_pdf tool
 is properly configured.
 """
 
+import asyncio
+import gzip
+import hashlib
+import os
+import socket
+import ssl
+import threading
+from types import SimpleNamespace
+
 import pytest
-from pdf_downloader_mcp import PDFDownloaderServer, PDFDownloader
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aiohttp import ClientConnectorError, ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from pdf_downloader_mcp import PDFDownloaderServer, PDFDownloader, ValidationError
+from pdf_downloader_mcp.downloader import DownloadOutcome, _FileWriter, _hash_file, _parse_content_range, _write_and_hash
+from pdf_downloader_mcp.validators import PDFValidator
+from pdf_downloader_mcp.utils import format_file_size, is_pdf_url, sanitize_filename, validate_url
+
+
+def _pdf_bytes(size):
+    """Return a minimal valid PDF padded to size bytes."""
+    head, tail = b"%PDF-1.7\n", b"\n%%EOF\n"
+    return head + os.urandom(size - len(head) - len(tail)) + tail
+
+
+def _pdf_server(files, trickle=False, ranges=True, gzip_body=False, log=None, fail_once=()):
+    """
+    Build a TestServer that serves in-memory files with Range support.
+    
+    Unknown names get a 404 and a range starting past the end a 416. With
+    ranges unset, Range headers are ignored and the whole file is sent,
+    and with gzip_body set it is sent gzip-encoded with its encoded
+    Content-Length. With trickle set, whole-file responses send their
+    first 256 KiB at once and the rest slowly, like a distant origin, so
+    they keep holding their connection while the client fetches other
+    ranges. The Range header of each request is appended to log, and the
+    first request with a Range header listed in fail_once gets a 503.
+    """
+    fail_once = set(fail_once)
+    
+    async def handler(request):
+        if log is not None:
+            log.append(request.headers.get("Range"))
+        if request.headers.get("Range") in fail_once:
+            fail_once.discard(request.headers["Range"])
+            raise web.HTTPServiceUnavailable(headers={"Retry-After": "0"})
+        data = files.get(request.match_info["name"])
+        if data is None:
+            raise web.HTTPNotFound()
+        if gzip_body:
+            return web.Response(body=gzip.compress(data), headers={"Content-Encoding": "gzip"})
+        
+        partial = ranges and "Range" in request.headers
+        http_range = request.http_range if partial else slice(None, None)
+        start = http_range.start or 0
+        stop = len(data) if http_range.stop is None else min(http_range.stop, len(data))
+        if start >= len(data):
+            raise web.HTTPRequestRangeNotSatisfiable(headers={"Content-Range": f"bytes */{len(data)}"})
+        
+        if partial:
+            response = web.StreamResponse(status=206)
+            response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{len(data)}"
+        else:
+            response = web.StreamResponse()
+        if ranges:
+            response.headers["Accept-Ranges"] = "bytes"
+        response.content_length = stop - start
+        await response.prepare(request)
+        
+        burst = 256 * 1024 if trickle and not partial else stop - start
+        try:
+            await response.write(data[start:start + burst])
+            for offset in range(start + burst, stop, 16 * 1024):
+                await asyncio.sleep(0.05)
+                await response.write(data[offset:offset + 16 * 1024])
+        except ConnectionResetError:
+            pass  # The client had all it needed
+        return response
+    
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    return TestServer(app)
+
+
+def _segmenting_downloader():
+    """Return a PDFDownloader that splits files of a few hundred KiB into segments."""
+    downloader = PDFDownloader()
+    downloader.WRITE_BUFFER_SIZE = 16 * 1024
+    downloader.SEGMENTED_MIN_SIZE = 64 * 1024
+    downloader.SEGMENT_SIZE = 128 * 1024
+    return downloader
+
+
+def _response_error(status, message="", headers=None):
+    """Build a ClientResponseError as raised for a response with status."""
+    request_info = RequestInfo(URL("https://example.com/a.pdf"), "GET", CIMultiDictProxy(CIMultiDict()))
+    return ClientResponseError(request_info, (), status=status, message=message, headers=headers)
 
 
 class TestPDFDownloaderServer:
@@ -34,7 +132,7 @@ class TestPDFDownloader:
         downloader = PDFDownloader()
         assert downloader is not None
         assert downloader.validator is not None
-        assert downloader._session is None  # Should be None until created
+        assert all(session is None for session in downloader._sessions)  # Created on first use
     
     def test_user_agents_available(self):
         """Test that User-Agent strings are configured."""
@@ -61,6 +159,14 @@ class TestPDFDownloader:
         # Test URL with no filename
         filename = downloader._extract_filename_from_url("https://example.com/")
         assert filename == "document.pdf"
+        
+        # Test URL with path parameters
+        filename = downloader._extract_filename_from_url("https://example.com/docs/a.pdf;jsessionid=ABC123")
+        assert filename == "a.pdf"
+        
+        # Test URL without a scheme
+        filename = downloader._extract_filename_from_url("example.com/a.pdf")
+        assert filename == "a.pdf"
     
     def test_calculate_backoff_delay(self):
         """Test exponential backoff calculation."""
@@ -68,19 +174,330 @@ class TestPDFDownloader:
         
         # Test first retry (attempt 0)
         delay = downloader._calculate_backoff_delay(0, 5.0)
-        assert 3.75 <= delay <= 6.25  # 5.0 ? 25% jitter
+        assert 0.0 <= delay <= 5.0  # Full jitter up to 5.0
         
         # Test second retry (attempt 1) 
         delay = downloader._calculate_backoff_delay(1, 5.0)
-        assert 7.5 <= delay <= 12.5  # 10.0 ? 25% jitter
+        assert 0.0 <= delay <= 10.0  # Full jitter up to 10.0
         
         # Test third retry (attempt 2)
         delay = downloader._calculate_backoff_delay(2, 5.0)
-        assert 15.0 <= delay <= 25.0  # 20.0 ? 25% jitter
+        assert 0.0 <= delay <= 20.0  # Full jitter up to 20.0
         
         # Test maximum delay cap (5 minutes)
         delay = downloader._calculate_backoff_delay(10, 5.0)
         assert delay <= 300.0
+        
+        # Very large attempt numbers must not overflow
+        delay = downloader._calculate_backoff_delay(5000, 5.0)
+        assert 0.0 <= delay <= 300.0
+    
+    def test_plan_segments(self):
+        """Test that segments cover the remaining byte range exactly."""
+        downloader = PDFDownloader()
+        total_size = 20 * 1024 * 1024 + 123
+        
+        segments = downloader._plan_segments(1000, total_size)
+        assert 1 < len(segments) <= downloader.MAX_SEGMENTS
+        assert segments[0][0] == 1000
+        assert segments[-1][1] == total_size
+        for previous, current in zip(segments, segments[1:]):
+            assert previous[1] == current[0]
+        assert all(done == 0 for _, _, done in segments)
+    
+    def test_parse_content_range(self):
+        """Test parsing of Content-Range headers."""
+        assert _parse_content_range("bytes 100-199/1000") == (100, 199, 1000)
+        assert _parse_content_range("bytes 0-99/*") == (0, 99, -1)
+        assert _parse_content_range("bytes */1000") == (-1, -1, 1000)
+        assert _parse_content_range("bytes abc") is None
+        assert _parse_content_range(None) is None
+    
+    def test_write_and_hash(self, tmp_path):
+        """Test that the streamed checksum matches the written file."""
+        chunks = [b"%PDF-1.7\n", b"x" * 70000, b"%%EOF\n"]
+        file_path = tmp_path / "out.pdf"
+        hasher = hashlib.sha256()
+        
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            _write_and_hash(fd, chunks, hasher=hasher)
+        finally:
+            os.close(fd)
+        
+        expected = hashlib.sha256(b"".join(chunks)).hexdigest()
+        assert file_path.read_bytes() == b"".join(chunks)
+        assert hasher.hexdigest() == expected
+        assert _hash_file(file_path, block_size=4096) == expected
+    
+    @pytest.mark.asyncio
+    async def test_file_writer_cancelled_flush(self, tmp_path, monkeypatch):
+        """Test that a cancelled flush waits for its write and never repeats it."""
+        started = threading.Event()
+        release = threading.Event()
+        offsets = []
+        
+        def slow_write_and_hash(fd, chunks, offset=None, hasher=None):
+            offsets.append(offset)
+            started.set()
+            release.wait(5)
+            _write_and_hash(fd, chunks, offset, hasher)
+        
+        monkeypatch.setattr("pdf_downloader_mcp.downloader._write_and_hash", slow_write_and_hash)
+        loop = asyncio.get_running_loop()
+        fd = os.open(tmp_path / "out.pdf", os.O_RDWR | os.O_CREAT, 0o644)
+        writer = _FileWriter(fd, 4, offset=0)
+        
+        task = asyncio.ensure_future(writer.write(b"%PDF-1.7"))
+        await loop.run_in_executor(None, started.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await writer.close()
+        
+        assert offsets == [0]
+        assert writer.offset == 8
+        assert (tmp_path / "out.pdf").read_bytes() == b"%PDF-1.7"
+    
+    @pytest.mark.asyncio
+    async def test_download_pdfs_bounded_and_ordered(self, tmp_path):
+        """Test that batch downloads keep job order and respect the limit."""
+        downloader = PDFDownloader()
+        downloader.CONNECTIONS_PER_HOST = 4
+        running = 0
+        peak = 0
+        
+        async def fake_download_with_resume(url, file_path, timeout, user_agent_index=0):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            file_path.write_bytes(_pdf_bytes(1000))
+            running -= 1
+            return DownloadOutcome(True, None, {"bytes_downloaded": 1000, "download_time": 0.01})
+        
+        downloader._download_with_resume = fake_download_with_resume
+        jobs = [{"url": f"https://example.com/{i}.pdf", "destination_path": str(tmp_path)} for i in range(6)]
+        
+        results = await downloader.download_pdfs(jobs)
+        assert [r["local_path"] for r in results] == [str(tmp_path / f"{i}.pdf") for i in range(6)]
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_download_pdfs_rejects_duplicate_targets(self, tmp_path):
+        """Test that a batch saving two URLs to one file is refused up front."""
+        downloader = PDFDownloader()
+        started = []
+        
+        async def fake_download_pdf(url, destination_path, filename=None):
+            started.append(url)
+            return {"success": True}
+        
+        downloader.download_pdf = fake_download_pdf
+        jobs = [
+            {"url": "https://example.com/a/report.pdf", "destination_path": str(tmp_path)},
+            {"url": "https://example.com/b.pdf", "destination_path": str(tmp_path)},
+            {"url": "https://example.org/report.pdf", "destination_path": str(tmp_path / ".")},
+        ]
+        
+        with pytest.raises(ValidationError, match="Jobs 0 and 2"):
+            await downloader.download_pdfs(jobs)
+        assert started == []
+        
+        jobs[2]["filename"] = "other.pdf"
+        results = await downloader.download_pdfs(jobs)
+        assert len(results) == 3
+    
+    @pytest.mark.asyncio
+    async def test_download_pdfs_segmented_batch(self, tmp_path):
+        """Test that a full batch of segmented downloads does not stall the pool."""
+        files = {f"{i}.pdf": _pdf_bytes(1024 * 1024) for i in range(32)}
+        downloader = _segmenting_downloader()
+        
+        async with _pdf_server(files, trickle=True) as server, downloader:
+            jobs = [
+                {"url": str(server.make_url(f"/{name}")), "destination_path": str(tmp_path / "out"),
+                 "max_retries": 0, "timeout": 5}
+                for name in files
+            ]
+            results = await downloader.download_pdfs(jobs)
+        
+        assert all(r["success"] for r in results), [r["error_message"] for r in results]
+        for name, data in files.items():
+            assert (tmp_path / "out" / name).read_bytes() == data
+
+
+class TestDownloadBehavior:
+    """Test downloads against a local HTTP server."""
+    
+    @pytest.mark.asyncio
+    async def test_plain_download(self, tmp_path):
+        """Test a small file fetched in one request and saved under its name."""
+        data = _pdf_bytes(50_000)
+        log = []
+        
+        async with _pdf_server({"paper.pdf": data}, log=log) as server, PDFDownloader() as downloader:
+            result = await downloader.download_pdf(str(server.make_url("/paper.pdf")), str(tmp_path))
+        
+        assert result["success"], result["error_message"]
+        assert result["local_path"] == str(tmp_path / "paper.pdf")
+        assert result["bytes_downloaded"] == len(data)
+        assert result["sha256"] == hashlib.sha256(data).hexdigest()
+        assert (tmp_path / "paper.pdf").read_bytes() == data
+        assert os.listdir(tmp_path) == ["paper.pdf"]
+        assert log == [None]
+    
+    @pytest.mark.asyncio
+    async def test_segmented_download(self, tmp_path):
+        """Test a large file fetched as parallel Range segments."""
+        data = _pdf_bytes(1024 * 1024)
+        log = []
+        
+        async with _pdf_server({"big.pdf": data}, log=log) as server, _segmenting_downloader() as downloader:
+            result = await downloader.download_pdf(str(server.make_url("/big.pdf")), str(tmp_path))
+        
+        assert result["success"], result["error_message"]
+        assert result["sha256"] == hashlib.sha256(data).hexdigest()
+        assert (tmp_path / "big.pdf").read_bytes() == data
+        assert os.listdir(tmp_path) == ["big.pdf"]
+        assert log[0] is None
+        assert len(log) == downloader.MAX_SEGMENTS
+        assert all(header.startswith("bytes=") for header in log[1:])
+    
+    @pytest.mark.asyncio
+    async def test_resume_from_checkpoint(self, tmp_path):
+        """Test that a checkpointed download only fetches the missing ranges."""
+        data = _pdf_bytes(1024 * 1024)
+        log = []
+        downloader = _segmenting_downloader()
+        part_path = tmp_path / "big.pdf.part"
+        
+        # The first segment finished and the second stopped halfway
+        segments = downloader._plan_segments(0, len(data))
+        segments[0][2] = segments[0][1] - segments[0][0]
+        segments[1][2] = (segments[1][1] - segments[1][0]) // 2
+        partial = bytearray(len(data))
+        for start, end, done in segments:
+            partial[start:start + done] = data[start:start + done]
+        part_path.write_bytes(bytes(partial))
+        downloader._save_progress(part_path, len(data), segments)
+        
+        async with _pdf_server({"big.pdf": data}, log=log) as server, downloader:
+            result = await downloader.download_pdf(str(server.make_url("/big.pdf")), str(tmp_path))
+        
+        assert result["success"], result["error_message"]
+        assert result["resumed"] is True
+        assert result["sha256"] == hashlib.sha256(data).hexdigest()
+        assert (tmp_path / "big.pdf").read_bytes() == data
+        assert os.listdir(tmp_path) == ["big.pdf"]
+        assert f"bytes={segments[0][0]}-{segments[0][1] - 1}" not in log
+        assert f"bytes={segments[1][0] + segments[1][2]}-{segments[1][1] - 1}" in log
+        assert len(log) == len(segments) - 1
+    
+    @pytest.mark.asyncio
+    async def test_segment_error_keeps_checkpoint(self, tmp_path):
+        """Test that a retryable error on one segment does not discard the others."""
+        data = _pdf_bytes(1024 * 1024)
+        log = []
+        downloader = _segmenting_downloader()
+        start, end, _ = downloader._plan_segments(0, len(data))[3]
+        failing = f"bytes={start}-{end - 1}"
+        
+        async with _pdf_server({"big.pdf": data}, log=log, fail_once=[failing]) as server, downloader:
+            result = await downloader.download_pdf(str(server.make_url("/big.pdf")), str(tmp_path))
+        
+        assert result["success"], result["error_message"]
+        assert result["attempts_used"] == 2
+        assert result["resumed"] is True
+        assert result["bytes_downloaded"] < len(data)
+        assert (tmp_path / "big.pdf").read_bytes() == data
+        assert os.listdir(tmp_path) == ["big.pdf"]
+        assert log.count(None) == 1
+        assert log.count(failing) == 2
+    
+    @pytest.mark.asyncio
+    async def test_range_ignored_restarts(self, tmp_path):
+        """Test that a 200 answer to a resume replaces the partial file."""
+        data = _pdf_bytes(200_000)
+        (tmp_path / "paper.pdf.part").write_bytes(b"stale bytes")
+        log = []
+        
+        async with _pdf_server({"paper.pdf": data}, ranges=False, log=log) as server, PDFDownloader() as downloader:
+            result = await downloader.download_pdf(str(server.make_url("/paper.pdf")), str(tmp_path))
+        
+        assert result["success"], result["error_message"]
+        assert result["resumed"] is False
+        assert (tmp_path / "paper.pdf").read_bytes() == data
+        assert os.listdir(tmp_path) == ["paper.pdf"]
+        assert log == ["bytes=11-"]
+    
+    @pytest.mark.asyncio
+    async def test_already_complete(self, tmp_path):
+        """Test that a 416 for a complete partial file finishes the download."""
+        data = _pdf_bytes(50_000)
+        (tmp_path / "paper.pdf.part").write_bytes(data)
+        
+        async with _pdf_server({"paper.pdf": data}) as server, PDFDownloader() as downloader:
+            result = await downloader.download_pdf(str(server.make_url("/paper.pdf")), str(tmp_path))
+        
+        assert result["success"], result["error_message"]
+        assert result["bytes_downloaded"] == 0
+        assert result["sha256"] == hashlib.sha256(data).hexdigest()
+        assert os.listdir(tmp_path) == ["paper.pdf"]
+    
+    @pytest.mark.asyncio
+    async def test_gzip_response(self, tmp_path):
+        """Test that a compressed body is saved whole despite its encoded size."""
+        data = b"%PDF-1.7\n" + os.urandom(512 * 1024) + bytes(512 * 1024) + b"\n%%EOF\n"
+        
+        async with _pdf_server({"big.pdf": data}, gzip_body=True) as server, _segmenting_downloader() as downloader:
+            result = await downloader.download_pdf(
+                str(server.make_url("/big.pdf")), str(tmp_path), max_retries=0
+            )
+        
+        assert result["success"], result["error_message"]
+        assert (tmp_path / "big.pdf").read_bytes() == data
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_direct_downloads(self, tmp_path):
+        """Test that concurrent download_pdf calls share the connection limit."""
+        files = {f"{i}.pdf": _pdf_bytes(1024 * 1024) for i in range(32)}
+        downloader = _segmenting_downloader()
+        
+        async with _pdf_server(files, trickle=True) as server, downloader:
+            results = await asyncio.gather(*(
+                downloader.download_pdf(
+                    str(server.make_url(f"/{name}")), str(tmp_path), max_retries=0, timeout=5
+                )
+                for name in files
+            ))
+        
+        assert all(r["success"] for r in results), [r["error_message"] for r in results]
+        for name, data in files.items():
+            assert (tmp_path / name).read_bytes() == data
+    
+    @pytest.mark.asyncio
+    async def test_failed_download_leaves_no_files(self, tmp_path):
+        """Test that missing files and non-PDF bodies leave nothing behind."""
+        files = {"page.pdf": b"<html>" + b"x" * 500 + b"</html>"}
+        
+        async with _pdf_server(files) as server, PDFDownloader() as downloader:
+            missing = await downloader.download_pdf(
+                str(server.make_url("/missing.pdf")), str(tmp_path), retry_delay=0.01
+            )
+            page = await downloader.download_pdf(
+                str(server.make_url("/page.pdf")), str(tmp_path), max_retries=1, retry_delay=0.01
+            )
+        
+        assert missing["success"] is False
+        assert missing["attempts_used"] == 1
+        assert page["success"] is False
+        assert "Invalid PDF" in page["error_message"]
+        assert os.listdir(tmp_path) == []
 
 
 class TestErrorClassification:
@@ -91,6 +508,160 @@ class TestErrorClassification:
         downloader = PDFDownloader()
         assert hasattr(downloader, '_classify_error')
         assert callable(downloader._classify_error)
+    
+    def test_error_classification_by_type(self):
+        """Test that errors are classified by their exception type."""
+        downloader = PDFDownloader()
+        
+        should_retry, _ = downloader._classify_error(_response_error(404, "Not Found"))
+        assert should_retry is False
+        
+        should_retry, _ = downloader._classify_error(_response_error(503))
+        assert should_retry is True
+        
+        should_retry, description = downloader._classify_error(asyncio.TimeoutError())
+        assert should_retry is True
+        assert description == "Request timeout"
+        
+        should_retry, description = downloader._classify_error(ValueError("boom"))
+        assert should_retry is True
+        assert description.startswith("Unknown error")
+    
+    def test_error_classification_fatal_and_transient(self):
+        """Test which client errors are retried before any backoff."""
+        downloader = PDFDownloader()
+        
+        for status, expected in ((405, False), (408, True), (429, True), (418, False)):
+            should_retry, _ = downloader._classify_error(_response_error(status))
+            assert should_retry is expected, status
+        
+        should_retry, _ = downloader._classify_error(ssl.SSLCertVerificationError("bad cert"))
+        assert should_retry is False
+    
+    def test_unknown_host_is_not_retried(self):
+        """Test that NXDOMAIN from either resolver is a permanent failure."""
+        downloader = PDFDownloader()
+        connection_key = SimpleNamespace(host="missing.example", port=443, ssl=True)
+        
+        # ThreadedResolver lets the socket.gaierror through
+        threaded = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        should_retry, description = downloader._classify_error(
+            ClientConnectorError(connection_key, threaded)
+        )
+        assert should_retry is False
+        assert description == "Host not found: missing.example"
+        
+        should_retry, _ = downloader._classify_error(
+            ClientConnectorError(connection_key, ConnectionRefusedError(111, "refused"))
+        )
+        assert should_retry is True
+    
+    def test_unknown_host_is_not_retried_async_resolver(self):
+        """Test that NXDOMAIN wrapped by AsyncResolver is a permanent failure."""
+        aiodns = pytest.importorskip("aiodns")
+        downloader = PDFDownloader()
+        connection_key = SimpleNamespace(host="missing.example", port=443, ssl=True)
+        
+        def async_resolver_error(code, message):
+            try:
+                try:
+                    raise aiodns.error.DNSError(code, message)
+                except aiodns.error.DNSError as exc:
+                    raise OSError(None, message) from exc
+            except OSError as exc:
+                return ClientConnectorError(connection_key, exc)
+        
+        should_retry, description = downloader._classify_error(
+            async_resolver_error(aiodns.error.ARES_ENOTFOUND, "Domain name not found")
+        )
+        assert should_retry is False
+        assert description == "Host not found: missing.example"
+        
+        should_retry, _ = downloader._classify_error(
+            async_resolver_error(aiodns.error.ARES_ETIMEOUT, "Timeout while contacting DNS servers")
+        )
+        assert should_retry is True
+    
+    def test_retry_after_delay(self):
+        """Test parsing of Retry-After seconds and dates."""
+        def rate_limited(retry_after):
+            headers = CIMultiDictProxy(CIMultiDict({"Retry-After": retry_after}))
+            return _response_error(429, headers=headers)
+        
+        assert PDFDownloader._retry_after_delay(rate_limited("12")) == 12.0
+        assert PDFDownloader._retry_after_delay(rate_limited("100000")) == 300.0
+        assert PDFDownloader._retry_after_delay(rate_limited("Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+        assert PDFDownloader._retry_after_delay(rate_limited("soon")) is None
+
+
+class TestPDFValidator:
+    """Test the PDF validation checks."""
+    
+    def test_validate_pdf_header(self):
+        """Test header detection at the start and after leading junk."""
+        validator = PDFValidator()
+        assert validator._validate_pdf_header(b"%PDF-1.7\n%\xe2\xe3") == (True, "1.7")
+        assert validator._validate_pdf_header(b"junk %PDF-9.9 %PDF-2.0\n") == (True, "2.0")
+        assert validator._validate_pdf_header(b"%PDF-3.0 unknown") == (False, None)
+        assert validator._validate_pdf_header(b"<html></html>") == (False, None)
+    
+    def test_validate_pdf_footer(self):
+        """Test trailer detection with and without the EOF marker."""
+        validator = PDFValidator()
+        assert validator._validate_pdf_footer(b"startxref\n1234\n%%EOF\n") == (True, [])
+        valid, warnings = validator._validate_pdf_footer(b"trailer\n<< /Root 1 0 R >>\n")
+        assert valid and len(warnings) == 1
+        assert validator._validate_pdf_footer(b"</body></html>\n")[0] is False
+
+
+class TestUtils:
+    """Test the filename and formatting helpers."""
+    
+    def test_sanitize_filename(self):
+        """Test that invalid characters and reserved names are handled."""
+        assert sanitize_filename('a<b>:c"d|e?f*g\\h/i.pdf') == "a_b__c_d_e_f_g_h_i.pdf"
+        assert sanitize_filename("bad\x00name.pdf") == "bad_name.pdf"
+        assert sanitize_filename("CON.pdf") == "_CON.pdf"
+        assert sanitize_filename("report") == "report.pdf"
+        assert sanitize_filename("") == "document.pdf"
+    
+    def test_format_file_size(self):
+        """Test human-readable size formatting."""
+        assert format_file_size(0) == "0 B"
+        assert format_file_size(1023) == "1023 B"
+        assert format_file_size(1024) == "1.0 KB"
+        assert format_file_size(1536) == "1.5 KB"
+        assert format_file_size(5 * 1024 ** 3) == "5.0 GB"
+        assert format_file_size(2 ** 60) == "1048576.0 TB"
+        assert format_file_size(1536.0) == "1.5 KB"
+    
+    def test_validate_url(self):
+        """Test URL validation for accepted and rejected URLs."""
+        assert validate_url("https://example.com/paper.pdf")
+        assert validate_url("http://localhost:8080/file")
+        assert validate_url("http://192.168.1.10/file.pdf")
+        assert validate_url("https://sub.example.co.uk/a?b=c")
+        assert validate_url("http://[::1]:8080/file.pdf")
+        assert validate_url("https://b\u00fccher.de/katalog.pdf")
+        assert not validate_url("http://999.1.1.1/file.pdf")
+        assert not validate_url("http://user@example.com/file.pdf")
+        assert not validate_url("http://example.com:")
+        assert not validate_url("http://example.com:/file.pdf")
+        assert not validate_url("ftp://example.com/file.pdf")
+        assert not validate_url("http://exa mple.com/file.pdf")
+        assert not validate_url("http://example.com:99999/")
+        assert not validate_url("http://example/file.pdf")
+        assert not validate_url("")
+    
+    def test_is_pdf_url(self):
+        """Test PDF URL detection without substring false positives."""
+        assert is_pdf_url("https://example.com/files/Report.PDF")
+        assert is_pdf_url("https://example.com/paper.pdf?download=1")
+        assert is_pdf_url("https://example.com/pdf/12345")
+        assert is_pdf_url("https://example.com/get?id=7&format=pdf")
+        assert not is_pdf_url("https://pdfwarehouse.com/docs/foo.html")
+        assert not is_pdf_url("https://example.com/pdfs.html")
+        assert not is_pdf_url("")
 
 
 if __name__ == "__main__":